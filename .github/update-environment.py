@@ -31,6 +31,8 @@ def generate_environment_yml(
             continue
         env_yaml += f"  # optional-dependencies: {group}\n"
         for dep in data["project"]["optional-dependencies"][group]:
+            # conda does not understand environment markers like "; sys_platform != 'win32'"
+            dep = dep.split(";")[0].strip()  # noqa: PLW2901
             env_yaml += f"  - {dep}\n"
 
     return env_yaml
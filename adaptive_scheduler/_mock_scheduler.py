@@ -38,7 +38,7 @@ class MockScheduler:
     ```
     python _mock_scheduler.py --queue
     python _mock_scheduler.py --submit JOB_NAME_HERE script_here.sh  # returns JOB_ID
-    python _mock_scheduler.py --cancel JOB_ID
+    python _mock_scheduler.py --cancel JOB_ID [JOB_ID ...]
     ```
 
     Parameters
@@ -221,7 +221,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--queue", action="store_true")
     parser.add_argument("--submit", action="store", nargs=2, type=str)
-    parser.add_argument("--cancel", action="store", type=str)
+    parser.add_argument("--cancel", action="store", nargs="+", type=str)
     parser.add_argument("--url", action="store", type=str, default=DEFAULT_URL)
     args = parser.parse_args()
 
@@ -231,6 +231,6 @@ if __name__ == "__main__":
         job_name, fname = args.submit
         print(submit(job_name, fname, args.url))
     elif args.cancel:
-        job_id = args.cancel
-        cancel(job_id, args.url)
+        for job_id in args.cancel:
+            cancel(job_id, args.url)
         print("Cancelled")
@@ -8,20 +8,47 @@ import sys
 import textwrap
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, wraps
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
+import toolz
 
 from adaptive_scheduler._scheduler.common import run_submit
 from adaptive_scheduler.utils import EXECUTOR_TYPES, _progress
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from typing import Any, ClassVar
 
 
 _MULTI_LINE_BREAK = " \\\n    "
+_CANCEL_CHUNK_SIZE = 256  # max number of job ids passed to a single cancel command
+_MAX_CANCEL_DELAY = 8.0  # max seconds to wait between cancel attempts
+
+
+def _cache_per_index(
+    method: Callable[..., str],
+) -> Callable[..., str]:
+    """Cache the output of a ``method(self, *, index)`` per ``index``.
+
+    The output is not cached if any of the options at ``index`` is a callable,
+    because those are evaluated at submission time.
+    """
+
+    @wraps(method)
+    def wrapper(self: BaseScheduler, *, index: int | None = None) -> str:
+        key = (method.__name__, index)
+        if key in self._per_index_cache:
+            return self._per_index_cache[key]
+        result = method(self, index=index)
+        if not self._has_callable_options(index):
+            self._per_index_cache[key] = result
+        return result
+
+    return wrapper
 
 
 class BaseScheduler(abc.ABC):
@@ -69,6 +96,15 @@ class BaseScheduler(abc.ABC):
     _options_flag: ClassVar[str]
     _cancel_cmd: ClassVar[str]
     _JOB_ID_VARIABLE: ClassVar[str] = "${JOB_ID}"
+    # Maps the executor type to the method that returns its part of the job script
+    _EXECUTOR_DISPATCH: ClassVar[dict[str, str]] = {
+        "mpi4py": "_mpi4py",
+        "dask-mpi": "_dask_mpi",
+        "ipyparallel": "_ipyparallel",
+        "process-pool": "_process_pool",
+        "loky": "_process_pool",
+        "sequential": "_sequential_executor",
+    }
 
     def __init__(
         self,
@@ -98,6 +134,8 @@ class BaseScheduler(abc.ABC):
         self._extra_script = extra_script if extra_script is not None else ""
         # This attribute is set in JobManager._setup ATM (hacky)
         self._command_line_options: dict[str, Any] | None = None
+        self._job_script_cache: dict[tuple[int | None, tuple], str] = {}
+        self._per_index_cache: dict[tuple[str, int | None], str] = {}
 
     @abc.abstractmethod
     def queue(self, *, me_only: bool = True) -> dict[str, dict]:
@@ -177,9 +215,7 @@ class BaseScheduler(abc.ABC):
 
     def job_names_to_job_ids(self, *job_names: str) -> list[str]:
         """Get the job_ids from the job_names in the queue."""
-        queue = self.queue()
-        job_name_to_id = {info["job_name"]: job_id for job_id, info in queue.items()}
-        return [job_name_to_id[job_name] for job_name in job_names if job_name in job_name_to_id]
+        return _job_names_to_job_ids(self.queue(), job_names)
 
     def cancel(
         self,
@@ -187,6 +223,7 @@ class BaseScheduler(abc.ABC):
         *,
         with_progress_bar: bool = True,
         max_tries: int = 5,
+        poll_interval: float = 0.5,
     ) -> None:
         """Cancel all jobs in `job_names`.
 
@@ -198,32 +235,48 @@ class BaseScheduler(abc.ABC):
             Display a progress bar using `tqdm`.
         max_tries
             Maximum number of attempts to cancel a job.
+        poll_interval
+            Time in seconds to wait before checking the queue again after the
+            first attempt. The waiting time doubles after every attempt
+            (up to 8 seconds).
 
         """
+        cancel_cmd = self._cancel_cmd.split()
+
+        def run_cancel_cmd(*job_ids: str) -> int:
+            return subprocess.run(
+                [*cancel_cmd, *job_ids],
+                stderr=subprocess.PIPE,
+                check=False,
+            ).returncode
 
         def cancel_jobs(job_ids: list[str]) -> None:
-            for job_id in _progress(job_ids, with_progress_bar, "Canceling jobs"):
-                cmd = f"{self._cancel_cmd} {job_id}".split()
-                returncode = subprocess.run(
-                    cmd,
-                    stderr=subprocess.PIPE,
-                    check=False,
-                ).returncode
-                if returncode != 0:
-                    warnings.warn(
-                        f"Couldn't cancel '{job_id}'.",
-                        UserWarning,
-                        stacklevel=2,
-                    )
+            chunks = toolz.partition_all(_CANCEL_CHUNK_SIZE, job_ids)
+            for chunk in _progress(chunks, with_progress_bar, "Canceling jobs"):
+                if run_cancel_cmd(*chunk) == 0:
+                    continue
+                # Cancel one by one (concurrently) to find out which job_id failed
+                with ThreadPoolExecutor(max_workers=min(32, len(chunk))) as ex:
+                    returncodes = list(ex.map(run_cancel_cmd, chunk))
+                for job_id, returncode in zip(chunk, returncodes, strict=True):
+                    if returncode != 0:
+                        warnings.warn(
+                            f"Couldn't cancel '{job_id}'.",
+                            UserWarning,
+                            stacklevel=2,
+                        )
 
         job_names_set = set(job_names)
-        for _ in range(max_tries):
-            job_ids = self.job_names_to_job_ids(*job_names_set)
+        delay = poll_interval
+        for attempt in range(max_tries):
+            job_ids = _job_names_to_job_ids(self.queue(), job_names_set)
             if not job_ids:
                 # no more running jobs
                 break
             cancel_jobs(job_ids)
-            time.sleep(0.5)
+            if attempt < max_tries - 1:  # no need to wait after the last attempt
+                time.sleep(delay)
+                delay = min(delay * 2, _MAX_CANCEL_DELAY)
 
     def _expand_options(
         self,
@@ -302,10 +355,10 @@ class BaseScheduler(abc.ABC):
         custom = (f"    --profile {profile}", f"--n {cores-1}")
         return start, custom
 
-    def _process_pool(self) -> tuple[str, ...]:
+    def _process_pool(self, *, index: int | None = None) -> tuple[str, ...]:  # noqa: ARG002
         return (f"{self.python_executable} {self.launcher}",)
 
-    def _sequential_executor(self) -> tuple[str, ...]:
+    def _sequential_executor(self, *, index: int | None = None) -> tuple[str, ...]:  # noqa: ARG002
         return (f"{self.python_executable} {self.launcher}",)
 
     def _executor_specific(
@@ -315,13 +368,15 @@ class BaseScheduler(abc.ABC):
         *,
         index: int | None = None,
     ) -> str:
-        start = ""
         executor_type = self._get_executor_type(index=index)
-        if executor_type == "mpi4py":
-            opts = self._mpi4py(index=index)
-        elif executor_type == "dask-mpi":
-            opts = self._dask_mpi(index=index)
-        elif executor_type == "ipyparallel":
+        try:
+            method = getattr(self, self._EXECUTOR_DISPATCH[executor_type])
+        except KeyError:
+            msg = (
+                "Use 'ipyparallel', 'dask-mpi', 'mpi4py', 'loky', 'sequential', or 'process-pool'."
+            )
+            raise NotImplementedError(msg) from None
+        if executor_type == "ipyparallel":
             cores = self._get_cores(index=index)
             if cores <= 1:
                 msg = (
@@ -329,25 +384,21 @@ class BaseScheduler(abc.ABC):
                     " the rest of the cores for the engines, so use more than 1 core."
                 )
                 raise ValueError(msg)
-            start, opts = self._ipyparallel(index=index)
-        elif executor_type in ("process-pool", "loky"):
-            opts = self._process_pool()
-        elif executor_type == "sequential":
-            opts = self._sequential_executor()
+            start, opts = method(index=index)
         else:
-            msg = (
-                "Use 'ipyparallel', 'dask-mpi', 'mpi4py', 'loky', 'sequential', or 'process-pool'."
-            )
-            raise NotImplementedError(msg)
+            start, opts = "", method(index=index)
         return start + self._expand_options(opts, name, options)
 
+    @cached_property
+    def _log_folder_path(self) -> Path:
+        # Only create the folder once instead of on every `log_fname` call
+        log_folder = Path(self.log_folder)
+        log_folder.mkdir(exist_ok=True)
+        return log_folder
+
     def log_fname(self, name: str) -> Path:
         """The filename of the log (with JOB_ID_VARIABLE)."""
-        if self.log_folder:
-            log_folder = Path(self.log_folder)
-            log_folder.mkdir(exist_ok=True)
-        else:
-            log_folder = Path.cwd()
+        log_folder = self._log_folder_path if self.log_folder else Path.cwd()
         return log_folder / f"{name}-{self._JOB_ID_VARIABLE}.log"
 
     def output_fnames(self, name: str) -> list[Path]:
@@ -370,6 +421,7 @@ class BaseScheduler(abc.ABC):
         assert index is not None
         return _maybe_call(self._extra_scheduler[index])
 
+    @_cache_per_index
     def extra_scheduler(self, *, index: int | None = None) -> str:
         """Scheduler options that go in the job script."""
         extra_scheduler: list[str] = self._extra_scheduler_list(index=index)
@@ -382,6 +434,7 @@ class BaseScheduler(abc.ABC):
         assert index is not None
         return _maybe_call(self.num_threads[index])  # type: ignore[index]
 
+    @_cache_per_index
     def extra_env_vars(self, *, index: int | None = None) -> str:
         """Environment variables that need to exist in the job script."""
         extra_env_vars: list[str]
@@ -405,6 +458,7 @@ class BaseScheduler(abc.ABC):
         )
         return "\n".join(f"export {arg}" for arg in extra_env_vars)
 
+    @_cache_per_index
     def extra_script(self, *, index: int | None = None) -> str:
         """Script that will be run before the main scheduler."""
         assert self._extra_script is not None
@@ -422,10 +476,27 @@ class BaseScheduler(abc.ABC):
         index: int | None = None,
     ) -> None:
         """Writes a job script."""
-        with self.batch_fname(name).open("w", encoding="utf-8") as f:
+        key = (index, tuple(options.items()))
+        job_script = self._job_script_cache.get(key)
+        if job_script is None:
             job_script = self.job_script(options, index=index)
+            if not self._has_callable_options(index):
+                self._job_script_cache[key] = job_script
+        with self.batch_fname(name).open("w", encoding="utf-8") as f:
             f.write(job_script)
 
+    def _has_callable_options(self, index: int | None) -> bool:
+        """Whether any of the per-job options at ``index`` is a callable.
+
+        Callables are evaluated at submission time, so their job scripts cannot be cached.
+        """
+        if index is None:
+            return False
+        return any(
+            isinstance(value, tuple) and len(value) > index and callable(value[index])
+            for value in vars(self).values()
+        )
+
     def _multi_job_script_options(self, index: int) -> dict[str, Any]:
         assert self._command_line_options is not None
         assert isinstance(self.cores, tuple)
@@ -466,6 +537,14 @@ class BaseScheduler(abc.ABC):
         self.__init__(**state)  # type: ignore[misc]
 
 
+def _job_names_to_job_ids(
+    queue: dict[str, dict],
+    job_names: Iterable[str],
+) -> list[str]:
+    job_name_to_id = {info["job_name"]: job_id for job_id, info in queue.items()}
+    return [job_name_to_id[job_name] for job_name in job_names if job_name in job_name_to_id]
+
+
 def _maybe_call(obj: Any) -> Any:
     if callable(obj):
         return obj()
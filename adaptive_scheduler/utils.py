@@ -602,7 +602,12 @@ def log_exception(log: Any, msg: str, exception: Exception) -> None:
 
 
 def _serialize(msg: Any) -> list:
-    return [cloudpickle.dumps(msg)]
+    # Requests and replies are mostly tuples of strings, which the C pickler
+    # handles much faster; only fall back to cloudpickle when that fails.
+    try:
+        return [pickle.dumps(msg, protocol=5)]
+    except Exception:  # noqa: BLE001
+        return [cloudpickle.dumps(msg)]
 
 
 def _deserialize(frames: list) -> Any:
@@ -1005,6 +1010,16 @@ class _TimeGoal:
         raise TypeError(msg)
 
 
+@functools.cache
+def _npoints_goal(goal: int) -> Callable[[adaptive.BaseLearner], bool]:
+    return lambda learner: learner.npoints >= goal
+
+
+@functools.cache
+def _loss_goal(goal: float) -> Callable[[adaptive.BaseLearner], bool]:
+    return lambda learner: learner.loss() <= goal
+
+
 def smart_goal(
     goal: GoalTypes,
     learners: list[adaptive.BaseLearner],
@@ -1028,9 +1043,9 @@ def smart_goal(
     if callable(goal):
         return goal
     if isinstance(goal, int):
-        return lambda learner: learner.npoints >= goal
+        return _npoints_goal(goal)
     if isinstance(goal, float):
-        return lambda learner: learner.loss() <= goal
+        return _loss_goal(goal)
     if isinstance(goal, timedelta | datetime):
         return _TimeGoal(goal)
     if goal is None:
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import mmap
 import os
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta
-from glob import glob
+from functools import cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
@@ -27,19 +32,26 @@ if TYPE_CHECKING:
     from adaptive_scheduler.utils import _DATAFRAME_FORMATS, FnamesTypes
 
 
-def _get_fnames(run_manager: RunManager, *, only_running: bool) -> list[Path]:
+def _get_fnames(
+    run_manager: RunManager,
+    *,
+    only_running: bool,
+    db_entries: list[dict[str, Any]] | None = None,
+) -> list[Path]:
     if only_running:
-        fnames = []
-        for entry in run_manager.database_manager.as_dicts():
+        if db_entries is None:
+            db_entries = run_manager.database_manager.as_dicts()
+        fnames: list[str] = []
+        for entry in db_entries:
             if entry["is_done"]:
                 continue
             if entry["log_fname"] is not None:
                 fnames.append(entry["log_fname"])
-            fnames += entry["output_logs"]
+            fnames.extend(entry["output_logs"])
         return sorted(map(Path, fnames))
     pattern = f"{run_manager.job_name}-*"
     logs = set(Path(run_manager.scheduler.log_folder).glob(pattern))
-    logs |= set(Path().glob(pattern))
+    logs.update(Path().glob(pattern))
     return sorted(logs)
 
 
@@ -48,15 +60,18 @@ def _failed_job_logs(
     run_manager: RunManager,
     *,
     only_running: bool,
+    db_entries: list[dict[str, Any]] | None = None,
 ) -> list[Path]:
-    running = {
-        Path(e["log_fname"]).stem
-        for e in run_manager.database_manager.as_dicts()
-        if e["log_fname"] is not None
-    }
+    if db_entries is None:
+        db_entries = run_manager.database_manager.as_dicts()
+    running = {Path(e["log_fname"]).stem for e in db_entries if e["log_fname"] is not None}
     fnames_set = {fname.stem for fname in fnames if fname.suffix != run_manager.scheduler.ext}
-    failed_set = fnames_set - running
-    failed = [Path(f) for stem in failed_set for f in glob(f"{stem}*")]  # noqa: PTH207
+    failed_stems = tuple(fnames_set - running)
+    failed: list[Path] = []
+    if failed_stems:
+        # Scan the directory once instead of globbing once per stem
+        with os.scandir() as entries:
+            failed = [Path(e.name) for e in entries if e.name.startswith(failed_stems)]
 
     def maybe_append(fname: str, other_dir: Path, lst: list[Path]) -> None:
         p = Path(fname)
@@ -77,11 +92,155 @@ def _failed_job_logs(
 
 
 def _files_that_contain(fnames: list[Path], text: str) -> list[Path]:
-    def contains(fname: Path, text: str) -> bool:
-        with fname.open("r", encoding="utf-8") as f:
-            return any(text in line for line in f)
+    needle = text.encode("utf-8")
+
+    def contains(fname: Path) -> bool:
+        try:
+            with fname.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(needle) != -1
+        except (ValueError, OSError):
+            # `mmap` raises a `ValueError` for empty files
+            return False
+
+    if not fnames:
+        return []
+    with ThreadPoolExecutor(max_workers=min(32, len(fnames))) as ex:
+        hits = list(ex.map(contains, fnames))
+    return [fname for fname, hit in zip(fnames, hits, strict=True) if hit]
+
+
+def _stat_cache(folder: Path) -> dict[str, float]:
+    """Return the modification times of all files in ``folder`` from one directory scan."""
+    mtimes: dict[str, float] = {}
+    try:
+        with os.scandir(folder) as entries:
+            for e in entries:
+                with suppress(OSError):
+                    mtimes[e.name] = e.stat().st_mtime
+    except FileNotFoundError:
+        pass
+    return mtimes
+
+
+def _last_editted(fname: Path, stat_cache: dict[str, float] | None = None) -> float:
+    if stat_cache is not None:
+        return stat_cache.get(fname.name, -1.0)
+    try:
+        return fname.stat().st_mtime
+    except FileNotFoundError:
+        return -1.0
+
+
+# Seconds between checks of a tailed log file
+_LOG_POLL_INTERVAL = 2.0
+
+
+@contextmanager
+def _watch_file(fname: Path) -> Generator[asyncio.Event | None, None, None]:
+    """Yield an `asyncio.Event` that is set whenever ``fname`` is modified.
+
+    Uses ``watchdog`` (inotify on Linux) if it is installed, otherwise yields ``None``.
+    """
+    try:
+        from watchdog.events import FileSystemEvent, FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        yield None
+        return
+
+    loop = asyncio.get_running_loop()
+    modified = asyncio.Event()
+    modified.set()  # to make sure the file is read at the start
+    path = os.fspath(fname.resolve())
+
+    def _set_if_path(event_path: bytes | str) -> None:
+        if os.fsdecode(event_path) == path:
+            loop.call_soon_threadsafe(modified.set)
+
+    # Only react to writes, not to opening or closing the file (e.g., by `_read_tail`)
+    class _Handler(FileSystemEventHandler):
+        def on_modified(self, event: FileSystemEvent) -> None:
+            _set_if_path(event.src_path)
+
+        def on_created(self, event: FileSystemEvent) -> None:
+            _set_if_path(event.src_path)
+
+        def on_moved(self, event: FileSystemEvent) -> None:
+            _set_if_path(event.dest_path)
+
+    observer = Observer()
+    observer.schedule(_Handler(), os.fspath(fname.resolve().parent), recursive=False)
+    observer.start()
+    try:
+        yield modified
+    finally:
+        observer.stop()
+        observer.join()
+
+
+async def _wait_for_modification(modified: asyncio.Event | None) -> None:
+    if modified is None:
+        await asyncio.sleep(_LOG_POLL_INTERVAL)
+        return
+    # inotify does not see writes from other hosts on network filesystems (e.g., NFS,
+    # Lustre, or GPFS where the jobs write their logs), so keep polling as often as
+    # without watchdog. The event only makes local writes show up immediately.
+    with suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(modified.wait(), timeout=_LOG_POLL_INTERVAL)
+    modified.clear()
+
+
+_PARSE_LOG_FILES_CACHE: WeakKeyDictionary[
+    RunManager,
+    tuple[tuple[tuple[str, float], ...], pd.DataFrame],
+] = WeakKeyDictionary()
+
+
+def _cached_parse_log_files(run_manager: RunManager) -> pd.DataFrame:
+    """Call `RunManager.parse_log_files` only if any of the parsed log files changed."""
+    # `parse_log_files` reads the `log_fname`s of the database, which are not
+    # necessarily the (filtered) file names that are displayed
+    log_fnames = [
+        Path(entry["log_fname"])
+        for entry in run_manager.database_manager.as_dicts()
+        if entry["log_fname"] is not None
+    ]
+    stat_caches = {folder: _stat_cache(folder) for folder in {f.parent for f in log_fnames}}
+    key = tuple((str(f), _last_editted(f, stat_caches[f.parent])) for f in log_fnames)
+    cached = _PARSE_LOG_FILES_CACHE.get(run_manager)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    df = run_manager.parse_log_files()
+    _PARSE_LOG_FILES_CACHE[run_manager] = (key, df)
+    return df
+
+
+@cache
+def _try_transform(f: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def _f(x: Any) -> Any:
+        try:
+            return f(x)
+        except Exception:  # noqa: BLE001
+            return x
+
+    return _f
+
+
+def _sort_key(x: float | str) -> float | int:
+    if isinstance(x, str):
+        return -1
+    return float(x)
+
 
-    return [fname for fname in fnames if contains(fname, text)]
+_SORT_BY_MAPPING: dict[str, tuple[str | None, Callable[[Any], str] | None]] = {
+    "Alphabetical": (None, lambda _: ""),
+    "CPU %": ("cpu_usage", lambda x: f"{x:.1f}%"),
+    "Mem %": ("mem_usage", lambda x: f"{x:.1f}%"),
+    "Last editted": ("timestamp", None),  # formatted vectorized in `_sort_fnames`
+    "Loss": ("latest_loss", lambda x: f"{x:.2e}"),
+    "npoints": ("npoints", lambda x: f"{x} pnts"),
+    "Elapsed time": ("elapsed_time", lambda x: f"{x / 1e9}s"),
+}
 
 
 def _sort_fnames(
@@ -89,68 +248,48 @@ def _sort_fnames(
     run_manager: RunManager,
     fnames: list[Path],
 ) -> list[Path] | list[tuple[str, Path]]:
-    def _try(f: Callable[[Any], Any]) -> Callable[[Any], Any]:
-        def _f(x: Any) -> Any:
-            try:
-                return f(x)
-            except Exception:  # noqa: BLE001
-                return x
-
-        return _f
-
-    def _sort_key(value: tuple[float | str, str]) -> tuple[float | int, str]:
-        x, fname = value
-        if isinstance(x, str):
-            return -1, fname
-        return float(x), fname
-
-    def _vec_timedelta(ts: pd.Timestamp) -> str:
-        now = np.datetime64(datetime.now())  # noqa: DTZ005
-        dt = np.timedelta64(now - ts, "s")  # type: ignore[operator]
-        return f"{dt} ago"
-
-    mapping = {
-        "Alphabetical": (None, lambda _: ""),
-        "CPU %": ("cpu_usage", lambda x: f"{x:.1f}%"),
-        "Mem %": ("mem_usage", lambda x: f"{x:.1f}%"),
-        "Last editted": ("timestamp", _vec_timedelta),
-        "Loss": ("latest_loss", lambda x: f"{x:.2e}"),
-        "npoints": ("npoints", lambda x: f"{x} pnts"),
-        "Elapsed time": ("elapsed_time", lambda x: f"{x / 1e9}s"),
-    }
-
-    def extract(df: pd.DataFrame, fname: Path, key: str) -> Any | str:
-        df_sel = df[df.log_fname.str.contains(fname.name)]
-        values = df_sel[key].to_numpy()
-        if values:
-            return values[0]
-        return "?"
-
     if sort_by != "Alphabetical":
-        fname_mapping = defaultdict(list)
-        for fname in fnames:
-            fname_mapping[fname.stem].append(fname)
+        # The sort is stable, so the files of a stem keep their (sorted) input order
+        by_stem = sorted(fnames, key=attrgetter("stem"))
+        fname_mapping = {stem: list(group) for stem, group in groupby(by_stem, attrgetter("stem"))}
 
-        df = run_manager.parse_log_files()
+        df = _cached_parse_log_files(run_manager)
         if df.empty:
             return fnames
         log_fnames = set(df.log_fname.apply(Path))  # type: ignore [arg-type]
-        df_key, transform = mapping[sort_by]
+        df_key, transform = _SORT_BY_MAPPING[sort_by]
         assert df_key is not None  # for mypy
         stems = [fname.stem for fname in log_fnames]
-        vals = [extract(df, fname, df_key) for fname in log_fnames]
-        val_stem = sorted(zip(vals, stems, strict=True), key=_sort_key, reverse=True)
+        values = df[df_key].to_numpy()
+        if df_key == "timestamp":
+            # Sample "now" once and format all ages in a single numpy op
+            now = np.datetime64(datetime.now())  # noqa: DTZ005
+            timestamps = values.astype("datetime64[ns]")
+            labels = [f"{dt} ago" for dt in (now - timestamps).astype("timedelta64[s]")]
+            values = timestamps.astype("int64")
+        else:
+            assert transform is not None  # for mypy
+            _transform = _try_transform(transform)
+            labels = [_transform(val) for val in values]
+        val_map: dict[str, tuple[float | int, str]] = {}
+        for log_fname, val, label in zip(df.log_fname, values, labels, strict=True):
+            val_map.setdefault(Path(log_fname).name, (_sort_key(val), label))
+        vals = [val_map.get(fname.name, (-1, "?")) for fname in log_fnames]
+        # The keys are precomputed, so the tuples are compared natively
+        val_stem = sorted(
+            ((key, stem, label) for (key, label), stem in zip(vals, stems, strict=True)),
+            reverse=True,
+        )
 
         result: list[tuple[str, Path]] = []
-        for val, stem in val_stem:
-            val = _try(transform)(val)  # noqa: PLW2901
-            for fname in fname_mapping[stem]:
-                result.append((f"{val}: {fname.name}", fname))  # noqa: PERF401
+        for _, stem, label in val_stem:
+            result.extend(
+                (f"{label}: {fname.name}", fname) for fname in fname_mapping.get(stem, ())
+            )
 
-        missing = fname_mapping.keys() - set(stems)
+        missing = set(fname_mapping).difference(stems)
         for stem in sorted(missing):
-            for fname in fname_mapping[stem]:
-                result.append((f"?: {fname.name}", fname))  # noqa: PERF401
+            result.extend((f"?: {fname.name}", fname) for fname in fname_mapping[stem])
         return result
 
     return fnames
@@ -158,18 +297,34 @@ def _sort_fnames(
 
 def _read_file(fname: Path, max_lines: int = 500) -> str:
     try:
-        with fname.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-            if len(lines) > max_lines:
-                lines = lines[-max_lines:]
-                lines.insert(0, f"Only displaying the last {max_lines} lines!")
-                lines.insert(1, "\n")
-            return "".join(lines)
-    except UnicodeDecodeError:
-        return f"Could not decode file ({fname})!"
+        with fname.open("r", encoding="utf-8", errors="replace") as f:
+            # Only keep the last `max_lines` in memory
+            lines = deque(f, maxlen=max_lines + 1)
+        if len(lines) > max_lines:
+            lines.popleft()
+            return f"Only displaying the last {max_lines} lines!\n" + "".join(lines)
+        return "".join(lines)
+    except Exception as e:  # noqa: BLE001
+        return f"Exception with trying to read {fname}:\n{e}."
+
+
+def _read_tail(fname: Path, max_lines: int = 500, max_bytes: int = 64 * 1024) -> str:
+    """Like `_read_file`, but only reads the last ``max_bytes`` of the file."""
+    try:
+        with fname.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            data = f.read()
     except Exception as e:  # noqa: BLE001
         return f"Exception with trying to read {fname}:\n{e}."
+    lines = data.decode("utf-8", errors="replace").splitlines(keepends=True)
+    if start > 0:
+        lines = lines[1:]  # the first line is (most likely) incomplete
+    if start > 0 or len(lines) > max_lines:
+        lines = lines[-max_lines:]
+        return f"Only displaying the last {len(lines)} lines!\n" + "".join(lines)
+    return "".join(lines)
 
 
 def log_explorer(run_manager: RunManager) -> ipyw.VBox:  # noqa: C901, PLR0915
@@ -186,12 +341,19 @@ def log_explorer(run_manager: RunManager) -> ipyw.VBox:  # noqa: C901, PLR0915
     ) -> Callable[[Any], None]:
         def on_click(_: Any) -> None:
             current_value = fname_dropdown.value
-            fnames = _get_fnames(run_manager, only_running=only_running_checkbox.value)
+            only_running = only_running_checkbox.value
+            db_entries = (
+                run_manager.database_manager.as_dicts()
+                if only_running or only_failed_checkbox.value
+                else None
+            )
+            fnames = _get_fnames(run_manager, only_running=only_running, db_entries=db_entries)
             if only_failed_checkbox.value:
                 fnames = _failed_job_logs(
                     fnames,
                     run_manager,
-                    only_running=only_running_checkbox.value,
+                    only_running=only_running,
+                    db_entries=db_entries,
                 )
             if contains_text.value.strip():
                 fnames = _files_that_contain(fnames, contains_text.value.strip())
@@ -203,25 +365,20 @@ def log_explorer(run_manager: RunManager) -> ipyw.VBox:  # noqa: C901, PLR0915
 
         return on_click
 
-    def _last_editted(fname: Path) -> float:
-        try:
-            return fname.stat().st_mtime
-        except FileNotFoundError:
-            return -1.0
-
     async def _tail_log(fname: Path, textarea: ipyw.Textarea) -> None:
         t = -2.0  # to make sure the update always triggers
-        while True:
-            await asyncio.sleep(2)
-            try:
-                t_new = _last_editted(fname)
-                if t_new > t:
-                    textarea.value = _read_file(fname, run_manager.max_log_lines)
-                    t = t_new
-            except asyncio.CancelledError:
-                return
-            except Exception:  # noqa: S110, BLE001
-                pass
+        with _watch_file(fname) as modified:
+            while True:
+                await _wait_for_modification(modified)
+                try:
+                    t_new = _last_editted(fname)
+                    if t_new > t:
+                        textarea.value = _read_tail(fname, run_manager.max_log_lines)
+                        t = t_new
+                except asyncio.CancelledError:
+                    return
+                except Exception:  # noqa: S110, BLE001
+                    pass
 
     def _tail(
         dropdown: ipyw.Dropdown,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -9,11 +11,7 @@ from unittest.mock import MagicMock, patch
 import adaptive
 import pytest
 
-from adaptive_scheduler.server_support import (
-    DatabaseManager,
-    JobManager,
-    get_allowed_url,
-)
+from adaptive_scheduler.server_support import DatabaseManager, JobManager
 
 from .helpers import PARTITIONS, MockScheduler, get_socket
 
@@ -23,6 +21,27 @@ if TYPE_CHECKING:
     import zmq.asyncio
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the ``--uvloop`` option."""
+    parser.addoption(
+        "--uvloop",
+        action="store_true",
+        help="Run the async tests on uvloop instead of the default asyncio event loop.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Use uvloop only when asked for, Jupyter runs the managers on the default loop."""
+    # Importing `adaptive` already switches to uvloop when it is installed
+    policy = None
+    if config.getoption("--uvloop"):
+        # uvloop has a lower per-callback overhead for the zmq round trips in the async tests
+        import uvloop
+
+        policy = uvloop.EventLoopPolicy()
+    asyncio.set_event_loop_policy(policy)
+
+
 @pytest.fixture()
 def mock_scheduler(tmp_path: Path) -> MockScheduler:
     """Fixture for creating a MockScheduler instance."""
@@ -39,7 +58,8 @@ def db_manager(
     tmp_path: Path,
 ) -> DatabaseManager:
     """Fixture for creating a DatabaseManager instance."""
-    url = get_allowed_url()
+    # The test sockets share the manager's context, so skip the TCP stack
+    url = f"inproc://db-manager-{uuid.uuid4().hex}"
     db_fname = str(tmp_path / "test_db.json")
     return DatabaseManager(url, mock_scheduler, db_fname, learners, fnames)
 
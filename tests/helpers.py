@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 
 import zmq.asyncio
 
+from adaptive_scheduler._server_support import database_manager
 from adaptive_scheduler.scheduler import BaseScheduler
 from adaptive_scheduler.utils import _deserialize, _serialize
 
@@ -93,6 +94,7 @@ class MockScheduler(BaseScheduler):
         job_names: list[str],
         with_progress_bar: bool = True,  # noqa: FBT001, ARG002, FBT002
         max_tries: int = 5,  # noqa: ARG002
+        poll_interval: float = 0.5,  # noqa: ARG002
     ) -> None:
         """Cancel mock jobs."""
         print("Canceling mock jobs:", job_names)
@@ -131,8 +133,13 @@ async def send_message(socket: zmq.asyncio.Socket, message: Any) -> Any:
 @contextmanager
 def get_socket(db_manager: DatabaseManager) -> zmq.asyncio.Socket:
     """Get ZMQ socket of a DatabaseManager."""
-    ctx = zmq.asyncio.Context.instance()
-    socket = ctx.socket(zmq.REQ)
+    # Share the DatabaseManager's context, so the client and server use the same
+    # IO thread and can also talk over ``inproc://``
+    socket = database_manager.ctx.socket(zmq.REQ)
+    # The socket usually connects before the DatabaseManager binds, so retry
+    # quickly instead of waiting the default 100 ms after `ready` is set.
+    socket.setsockopt(zmq.RECONNECT_IVL, 5)
     socket.connect(db_manager.url)
+    # One socket is reused for all `send_message` calls of a test
     yield socket
-    socket.close()
+    socket.close(linger=0)
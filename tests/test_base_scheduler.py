@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import textwrap
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from adaptive_scheduler.scheduler import BaseScheduler
+
 from .helpers import MockScheduler
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_base_scheduler_job_script() -> None:
     """Test the BaseScheduler.job_script method."""
@@ -78,6 +85,102 @@ def test_cancel() -> None:
     assert queue_info["1"]["job_name"] == "test_job2"
 
 
+def test_base_scheduler_cancel_batches_job_ids() -> None:
+    """Test that BaseScheduler.cancel passes all job ids to one cancel command."""
+    scheduler = MockScheduler(cores=2)
+    for i in range(3):
+        scheduler.start_job(f"test_job{i}")
+
+    def run(cmd: list[str], **_: object) -> MagicMock:
+        for job_id in cmd[1:]:
+            scheduler._queue_info.pop(job_id, None)
+        return MagicMock(returncode=0)
+
+    with (
+        patch("adaptive_scheduler._scheduler.base_scheduler.subprocess.run") as mock_run,
+        patch("adaptive_scheduler._scheduler.base_scheduler.time.sleep"),
+    ):
+        mock_run.side_effect = run
+        BaseScheduler.cancel(scheduler, ["test_job0", "test_job2"], with_progress_bar=False)
+
+    mock_run.assert_called_once()
+    cmd = mock_run.call_args.args[0]
+    assert cmd[0] == "echo"
+    assert sorted(cmd[1:]) == ["0", "2"]
+    assert list(scheduler.queue()) == ["1"]
+
+
+def test_base_scheduler_cancel_reports_failed_job_ids() -> None:
+    """Test that BaseScheduler.cancel warns about the job ids it could not cancel."""
+    scheduler = MockScheduler(cores=2)
+    for i in range(3):
+        scheduler.start_job(f"test_job{i}")
+
+    def run(cmd: list[str], **_: object) -> MagicMock:
+        job_ids = cmd[1:]
+        if "1" in job_ids:
+            return MagicMock(returncode=1)
+        for job_id in job_ids:
+            scheduler._queue_info.pop(job_id, None)
+        return MagicMock(returncode=0)
+
+    with (
+        patch("adaptive_scheduler._scheduler.base_scheduler.subprocess.run") as mock_run,
+        patch("adaptive_scheduler._scheduler.base_scheduler.time.sleep"),
+        pytest.warns(UserWarning, match="Couldn't cancel '1'"),
+    ):
+        mock_run.side_effect = run
+        BaseScheduler.cancel(
+            scheduler,
+            ["test_job0", "test_job1", "test_job2"],
+            with_progress_bar=False,
+            max_tries=1,
+        )
+    assert list(scheduler.queue()) == ["1"]
+
+
+def test_base_scheduler_cancel_back_to_back() -> None:
+    """Test that a second cancel sees jobs started after the first one."""
+    scheduler = MockScheduler(cores=2)
+    # Like parsing `squeue`, every `queue()` call returns a new dict
+    queue = scheduler.queue
+    scheduler.queue = lambda **kw: dict(queue(**kw))  # type: ignore[method-assign]
+    scheduler.start_job("a")
+
+    def run(cmd: list[str], **_: object) -> MagicMock:
+        for job_id in cmd[1:]:
+            scheduler._queue_info.pop(job_id, None)
+        return MagicMock(returncode=0)
+
+    with (
+        patch("adaptive_scheduler._scheduler.base_scheduler.subprocess.run") as mock_run,
+        patch("adaptive_scheduler._scheduler.base_scheduler.time.sleep"),
+    ):
+        mock_run.side_effect = run
+        BaseScheduler.cancel(scheduler, ["a"], with_progress_bar=False)
+        scheduler.start_job("b")
+        BaseScheduler.cancel(scheduler, ["b"], with_progress_bar=False)
+
+    assert mock_run.call_count == 2
+    assert scheduler._queue_info == {}
+
+
+def test_base_scheduler_cancel_backoff() -> None:
+    """Test that BaseScheduler.cancel waits exponentially longer between attempts."""
+    scheduler = MockScheduler(cores=2)
+    scheduler.start_job("test_job")
+
+    with (
+        patch("adaptive_scheduler._scheduler.base_scheduler.subprocess.run") as mock_run,
+        patch("adaptive_scheduler._scheduler.base_scheduler.time.sleep") as mock_sleep,
+    ):
+        mock_run.return_value = MagicMock(returncode=0)
+        BaseScheduler.cancel(scheduler, ["test_job"], with_progress_bar=False, max_tries=6)
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert delays == [0.5, 1.0, 2.0, 4.0, 8.0]  # no sleep after the last attempt
+
+
 def test_update_queue() -> None:
     """Test the update_queue method of MockScheduler."""
     scheduler = MockScheduler(cores=2)
@@ -195,3 +298,41 @@ def test_callable_scheduler_arguments() -> None:
     executor_type1 = s._get_executor_type(index=1)
     assert executor_type0 == "ipyparallel"
     assert executor_type1 == "mpi4py"
+
+
+def test_write_job_script_cache(tmp_path: Path) -> None:
+    """Test that job scripts are only generated once unless they contain callables."""
+    s = MockScheduler(
+        cores=(4, lambda: 2),
+        executor_type=("mpi4py", "mpi4py"),
+        batch_folder=tmp_path,
+    )
+    with patch.object(s, "job_script", return_value="script") as job_script:
+        for _ in range(3):
+            s.write_job_script("job0", {}, index=0)
+            s.write_job_script("job1", {}, index=1)
+    assert job_script.call_count == 1 + 3
+    assert (tmp_path / "job0.mock").read_text() == "script"
+
+
+def test_extra_options_cache() -> None:
+    """Test that the extra options are cached unless they are callables."""
+    n_calls = 0
+
+    def extra_script() -> str:
+        nonlocal n_calls
+        n_calls += 1
+        return "echo 'func'"
+
+    s = MockScheduler(
+        cores=(4, 2),
+        executor_type=("mpi4py", "mpi4py"),
+        num_threads=(1, 1),
+        extra_env_vars=(["from=static"], ["from=static"]),
+        extra_script=(extra_script, "echo 'static'"),
+    )
+    assert s.extra_env_vars(index=1) is s.extra_env_vars(index=1)
+    assert s.extra_script(index=1) == "echo 'static'"
+    for _ in range(3):
+        assert s.extra_script(index=0) == "echo 'func'"
+    assert n_calls == 3
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict
 from pathlib import Path
+from typing import Any
 
 import adaptive
 import pytest
 import zmq
 
+from adaptive_scheduler._server_support import database_manager
 from adaptive_scheduler._server_support.database_manager import (
     DatabaseManager,
     SimpleDatabase,
@@ -56,6 +59,47 @@ def test_simple_database_update(tmp_path: Path) -> None:
     assert db.all()[1].is_done is True
 
 
+def test_simple_database_update_without_changes(tmp_path: Path) -> None:
+    """Test that an update that matches no entries does not rewrite the file."""
+    db_fname = tmp_path / "test_db.json"
+    db = SimpleDatabase(db_fname)
+    db.insert_multiple([_DBEntry(fname="file1.txt")])
+    db_fname.unlink()
+    db.update({"is_done": True}, indices=[])
+    assert not db_fname.exists()
+    db.update({"is_done": True}, indices=[0, 0])
+    assert db_fname.exists()
+    assert db.all()[0].is_done is True
+
+
+@pytest.mark.parametrize("with_orjson", [True, False])
+def test_simple_database_reload(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    with_orjson: bool,  # noqa: FBT001
+) -> None:
+    """Test that a saved database is loaded again from its file."""
+    if not with_orjson:
+        monkeypatch.setattr(database_manager, "orjson", None)
+    db_fname = tmp_path / "test_db.json"
+    db = SimpleDatabase(db_fname)
+    db.insert_multiple([_DBEntry(fname="file1.txt"), _DBEntry(fname=["a.txt", "b.txt"])])
+    db.update({"is_done": True, "output_logs": ["x.out"]}, indices=[1])
+    assert SimpleDatabase(db_fname).all() == db.all()
+
+
+def test_simple_database_as_dicts(tmp_path: Path) -> None:
+    """Test that as_dicts returns copies that match `dataclasses.asdict`."""
+    db = SimpleDatabase(tmp_path / "test_db.json")
+    db.insert_multiple([_DBEntry(fname=["a.txt", "b.txt"], output_logs=["x.out"])])
+    (d,) = db.as_dicts()
+    assert d == asdict(db.all()[0])
+    d["fname"].append("c.txt")
+    d["output_logs"].clear()
+    assert db.all()[0].fname == ["a.txt", "b.txt"]
+    assert db.all()[0].output_logs == ["x.out"]
+
+
 def test_simple_database_count(tmp_path: Path) -> None:
     """Test counting entries in the database."""
     db_fname = tmp_path / "test_db.json"
@@ -86,6 +130,30 @@ def test_simple_database_get_and_contains(tmp_path: Path) -> None:
     assert not db.contains(lambda entry: entry.fname == "file4.txt")
 
 
+def test_simple_database_get_with_index(tmp_path: Path) -> None:
+    """Test getting the first matching entry together with its index."""
+    db = SimpleDatabase(tmp_path / "test_db.json")
+    db.insert_multiple([_DBEntry(fname="file1.txt"), _DBEntry(fname="file2.txt")])
+    found = db.get_with_index(lambda entry: entry.fname == "file2.txt")
+    assert found is not None
+    index, entry = found
+    assert index == 1
+    assert entry is db.all()[1]
+    assert db.get_with_index(lambda entry: entry.fname == "file3.txt") is None
+
+
+def test_simple_database_indices_of(tmp_path: Path) -> None:
+    """Test looking up entry indices by fname, also after reloading the file."""
+    db_fname = tmp_path / "test_db.json"
+    db = SimpleDatabase(db_fname)
+    db.insert_multiple([_DBEntry(fname="file1.txt"), _DBEntry(fname=["a.txt", "b.txt"])])
+    db.insert_multiple([_DBEntry(fname="file1.txt")])
+    assert db.indices_of("file1.txt") == [0, 2]
+    assert db.indices_of(["a.txt", "b.txt"]) == [1]
+    assert db.indices_of("file2.txt") == []
+    assert SimpleDatabase(db_fname).indices_of(["a.txt", "b.txt"]) == [1]
+
+
 def test_simple_database_get_all(tmp_path: Path) -> None:
     """Test getting all entries in the database."""
     db_fname = tmp_path / "test_db.json"
@@ -106,7 +174,7 @@ def test_simple_database_get_all(tmp_path: Path) -> None:
 async def test_database_manager_start_and_cancel(db_manager: DatabaseManager) -> None:
     """Test starting and canceling the DatabaseManager."""
     db_manager.start()
-    await asyncio.sleep(0.1)  # Give it some time to start
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
     assert db_manager.is_started
     with pytest.raises(Exception, match="already started"):
         db_manager.start()
@@ -129,6 +197,7 @@ def test_smart_goal(learners: list) -> None:
     assert not goal(learners[1])
     goal = smart_goal(0, learners)
     assert goal(learners[0])
+    assert smart_goal(100, learners) is smart_goal(100, learners)
 
 
 def test_database_manager_create_empty_db(db_manager: DatabaseManager) -> None:
@@ -212,9 +281,10 @@ async def test_database_manager_start_and_update(
     fnames: list[str] | list[Path],
 ) -> None:
     """Test starting and updating jobs."""
-    db_manager.create_empty_db()
-    db_manager.start()
-    await asyncio.sleep(0.1)  # Give it some time to start
+    db_manager.start()  # creates the empty database
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
+    db = db_manager._db
+    assert db is not None
 
     job_id, log_fname, job_name = "1000", "log.log", "job_name"
 
@@ -231,8 +301,7 @@ async def test_database_manager_start_and_update(
     assert fname == _ensure_str(fnames[0]), fname
 
     # Check that the database is updated correctly
-    assert db_manager._db is not None
-    entry = db_manager._db.get(lambda entry: entry.fname == fname)
+    entry = db.get(lambda entry: entry.fname == fname)
     assert entry is not None
     assert entry.job_id == job_id
     assert entry.log_fname == log_fname
@@ -243,7 +312,7 @@ async def test_database_manager_start_and_update(
     db_manager.update(queue)
 
     # Check that the database is the same
-    entry = db_manager._db.get(lambda entry: entry.fname == fname)
+    entry = db.get(lambda entry: entry.fname == fname)
     assert entry is not None
     assert entry.job_id == job_id
     assert entry.log_fname == log_fname
@@ -254,7 +323,7 @@ async def test_database_manager_start_and_update(
     db_manager.update(queue)
 
     # Check that the database is updated correctly
-    entry = db_manager._db.get(lambda entry: entry.fname == fname)
+    entry = db.get(lambda entry: entry.fname == fname)
     assert entry is not None
     assert entry.job_id is None
 
@@ -266,9 +335,10 @@ async def test_database_manager_start_stop(
     fnames: list[str] | list[Path],
 ) -> None:
     """Test starting and stopping jobs."""
-    db_manager.create_empty_db()
-    db_manager.start()
-    await asyncio.sleep(0.1)  # Give it some time to start
+    db_manager.start()  # creates the empty database
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
+    db = db_manager._db
+    assert db is not None
     assert db_manager.task is not None
 
     job_id, log_fname, job_name = "1000", "log.log", "job_name"
@@ -285,9 +355,8 @@ async def test_database_manager_start_stop(
     assert "The job_id 1000 already exists in the database and runs" in str(exception)
     assert fname == _ensure_str(fnames[0]), fname
 
-    assert db_manager._db is not None
     # Check that the database is updated correctly
-    entry = db_manager._db.get(lambda entry: entry.fname == fname)
+    entry = db.get(lambda entry: entry.fname == fname)
     assert entry is not None
     assert entry.job_id == job_id
     assert entry.log_fname == log_fname
@@ -302,8 +371,7 @@ async def test_database_manager_start_stop(
     reply = await send_message(socket, stop_message)
     assert reply is None
 
-    assert db_manager._db is not None
-    entry = db_manager._db.get(lambda entry: entry.fname == _ensure_str(fnames[0]))
+    entry = db.get(lambda entry: entry.fname == _ensure_str(fnames[0]))
     assert entry is not None
     assert entry.job_id is None
 
@@ -322,6 +390,34 @@ async def test_database_manager_start_stop(
         await send_message(socket, start_message)
 
 
+@pytest.mark.asyncio()
+async def test_database_manager_without_add_reader(
+    socket: zmq.asyncio.Socket,
+    db_manager: DatabaseManager,
+    fnames: list[str] | list[Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the `zmq.asyncio` fallback for event loops without `add_reader`."""
+    loop = asyncio.get_running_loop()
+
+    def add_reader(*args: Any) -> None:  # noqa: ARG001
+        # Only reject the manager's own reader, `zmq.asyncio` uses `add_reader` too
+        monkeypatch.undo()
+        raise NotImplementedError
+
+    monkeypatch.setattr(loop, "add_reader", add_reader)
+    db_manager.start()
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
+    index, _ = db_manager._choose_fname()
+    db_manager._confirm_submitted(index, "job_name")
+    fname = await send_message(socket, ("start", "1000", "log.log", "job_name"))
+    assert fname == _ensure_str(fnames[0])
+    assert await send_message(socket, ("stop", fname)) is None
+    assert db_manager.task is not None
+    assert not db_manager.task.done()
+    db_manager.cancel()
+
+
 @pytest.mark.asyncio()
 async def test_database_manager_stop_request_and_requests(
     socket: zmq.asyncio.Socket,
@@ -331,7 +427,7 @@ async def test_database_manager_stop_request_and_requests(
     """Test stopping jobs using stop_request and stop_requests methods."""
     db_manager.create_empty_db()
     db_manager.start()
-    await asyncio.sleep(0.1)  # Give it some time to start
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
     assert db_manager.task is not None
     assert db_manager._db is not None
 
@@ -493,6 +589,9 @@ def test_job_failure_before_start_request_interleaved2(
             [Path("path1"), Path("path2"), Path("path3"), Path("path4")],
             ["path1", "path2", "path3", "path4"],
         ),
+        # Test with a list of mixed strings and Path objects
+        (["path1", Path("path2")], ["path1", "path2"]),
+        ([Path("path1"), "path2"], ["path1", "path2"]),
         # Test with a list of lists of strings
         (
             [["path1", "path2"], ["path3", "path4"]],
@@ -541,7 +640,7 @@ async def test_dependencies(
     db_manager.dependencies = {1: [0]}
     db_manager.create_empty_db()
     db_manager.start()
-    await asyncio.sleep(0.1)  # Give it some time to start
+    await asyncio.wait_for(db_manager.ready.wait(), timeout=1)
     assert db_manager.task is not None
     assert db_manager._db is not None
 
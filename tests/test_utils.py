@@ -623,3 +623,12 @@ def test_datetime_now() -> None:
 
     assert now == now_roundtripped.isoformat()
     assert utils._time_between(now, now) == 0
+
+
+def test_serialize_roundtrip() -> None:
+    """Test that messages survive `_serialize` and `_deserialize`."""
+    msg = ("start", "1000", "log.log", "job_name")
+    assert utils._deserialize(utils._serialize(msg)) == msg
+    # Objects that the standard pickler cannot handle fall back to cloudpickle
+    f = lambda x: x + 1  # noqa: E731
+    assert utils._deserialize(utils._serialize(f))(1) == 2
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import sys
 import tempfile
 from datetime import timedelta
 from pathlib import Path
@@ -13,21 +14,30 @@ from unittest.mock import patch
 
 import pandas as pd
 
+from adaptive_scheduler import widgets
 from adaptive_scheduler.widgets import (
     _bytes_to_human_readable,
     _failed_job_logs,
     _files_that_contain,
     _get_fnames,
     _interp_red_green,
+    _last_editted,
+    _read_file,
+    _read_tail,
     _sort_fnames,
+    _stat_cache,
     _timedelta_to_human_readable,
     _total_size,
+    _wait_for_modification,
+    _watch_file,
     info,
     log_explorer,
     queue_widget,
     results_widget,
 )
 
+from .helpers import temporary_working_directory
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -174,6 +184,38 @@ def test_files_that_contain2(tmp_path: Path) -> None:
     assert result == [p1]
 
 
+def test_files_that_contain_empty_and_missing(tmp_path: Path) -> None:
+    """Test that _files_that_contain skips empty and missing files."""
+    empty = tmp_path / "empty.log"
+    empty.touch()
+    missing = tmp_path / "missing.log"
+    p = tmp_path / "test.log"
+    p.write_text("Hello, world!")
+    assert _files_that_contain([empty, missing, p], "world") == [p]
+
+
+def test_read_file(tmp_path: Path) -> None:
+    """Test the _read_file function."""
+    fname = tmp_path / "test.log"
+    fname.write_text("".join(f"line {i}\n" for i in range(10)))
+    assert _read_file(fname, max_lines=10) == fname.read_text()
+    assert _read_file(fname, max_lines=3) == (
+        "Only displaying the last 3 lines!\nline 7\nline 8\nline 9\n"
+    )
+    fname.write_bytes(b"invalid \xff utf-8")
+    assert _read_file(fname) == "invalid \ufffd utf-8"
+
+
+def test_read_tail(tmp_path: Path) -> None:
+    """Test the _read_tail function."""
+    fname = tmp_path / "test.log"
+    fname.write_text("".join(f"line {i}\n" for i in range(10)))
+    assert _read_tail(fname) == fname.read_text()
+    assert _read_tail(fname, max_lines=2) == "Only displaying the last 2 lines!\nline 8\nline 9\n"
+    # Only the last 10 bytes, the incomplete first line is dropped
+    assert _read_tail(fname, max_bytes=10) == "Only displaying the last 1 lines!\nline 9\n"
+
+
 def test_get_fnames(tmp_path: Path) -> None:
     """Test the _get_fnames function."""
     d = tmp_path / "logs"
@@ -190,6 +232,7 @@ def test_get_fnames(tmp_path: Path) -> None:
 
     fnames = _get_fnames(run_manager, only_running=True)  # type: ignore[arg-type]
     assert len(fnames) == 6
+    assert fnames == sorted(fnames)
 
 
 def test_failed_job_logs(tmp_path: Path) -> None:
@@ -208,6 +251,18 @@ def test_failed_job_logs(tmp_path: Path) -> None:
     assert failed_fnames == []
 
 
+def test_failed_job_logs_not_running(tmp_path: Path) -> None:
+    """Test that _failed_job_logs finds all files of jobs that are not running."""
+    run_manager = MockRunManager(tmp_path)
+    (tmp_path / "adaptive-5-1005.log").write_text("Log 5")
+    (tmp_path / "adaptive-5-1005.out").write_text("Out 5")
+    (tmp_path / "adaptive-6-1006.out").write_text("Out 6")
+    fnames = [tmp_path / "adaptive-5-1005.out", tmp_path / "adaptive-0-1000.out"]
+    with temporary_working_directory(tmp_path):
+        failed_fnames = _failed_job_logs(fnames, run_manager, only_running=False)  # type: ignore[arg-type]
+    assert sorted(failed_fnames) == [Path("adaptive-5-1005.log"), Path("adaptive-5-1005.out")]
+
+
 def test_timedelta_to_human_readable_int() -> None:
     """Test the _timedelta_to_human_readable function with an integer."""
     seconds = 3666
@@ -293,6 +348,172 @@ def test_sort_fnames(tmp_path: Path) -> None:
     assert sorted_fnames == fnames  # In this case, they should be the same
 
 
+def test_stat_cache(tmp_path: Path) -> None:
+    """Test that _stat_cache returns the same mtimes as _last_editted."""
+    for i in range(3):
+        (tmp_path / f"{i}.log").write_text(f"Log {i}")
+    cache = _stat_cache(tmp_path)
+    assert set(cache) == {"0.log", "1.log", "2.log"}
+    fname = tmp_path / "0.log"
+    assert _last_editted(fname, cache) == _last_editted(fname)
+    assert _last_editted(tmp_path / "missing.log", cache) == -1.0
+    assert _stat_cache(tmp_path / "missing") == {}
+
+
+async def test_watch_file(tmp_path: Path) -> None:
+    """Test that _watch_file sets the event when the file is modified."""
+    fname = tmp_path / "job.log"
+    fname.write_text("")
+    with _watch_file(fname) as modified:
+        assert modified is not None
+        assert modified.is_set()  # to read the file at the start
+        await _wait_for_modification(modified)
+        assert not modified.is_set()
+        fname.write_text("Log")
+        await asyncio.wait_for(modified.wait(), timeout=5)
+        await _wait_for_modification(modified)
+        assert not modified.is_set()
+
+
+async def test_watch_file_ignores_reads(tmp_path: Path) -> None:
+    """Test that reading the watched file does not set the event."""
+    fname = tmp_path / "job.log"
+    fname.write_text("Log")
+    with _watch_file(fname) as modified:
+        assert modified is not None
+        modified.clear()
+        assert _read_tail(fname, 10) == "Log"
+        await asyncio.sleep(0.2)  # let the observer thread deliver any events
+        assert not modified.is_set()
+        fname.with_suffix(".tmp").write_text("Moved")
+        fname.with_suffix(".tmp").replace(fname)
+        await asyncio.wait_for(modified.wait(), timeout=5)
+
+
+async def test_wait_for_modification_polls(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the file is still polled when no event arrives, e.g., on NFS."""
+    monkeypatch.setattr(widgets, "_LOG_POLL_INTERVAL", 0.01)
+    fname = tmp_path / "job.log"
+    fname.write_text("")
+    with _watch_file(fname) as modified:
+        assert modified is not None
+        modified.clear()
+        await asyncio.wait_for(_wait_for_modification(modified), timeout=1)
+
+
+async def test_watch_file_without_watchdog(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that _watch_file falls back to polling if watchdog is not installed."""
+    monkeypatch.setitem(sys.modules, "watchdog.events", None)
+    monkeypatch.setitem(sys.modules, "watchdog.observers", None)
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    with _watch_file(tmp_path / "job.log") as modified:
+        assert modified is None
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        await _wait_for_modification(modified)
+    assert delays == [widgets._LOG_POLL_INTERVAL]
+
+
+def test_sort_fnames_by_value(tmp_path: Path) -> None:
+    """Test the _sort_fnames function with a sort key from the parsed logs."""
+    run_manager = MockRunManager(tmp_path)
+    fnames = [tmp_path / f"{run_manager.job_name}-{i}-{i * 100}.log" for i in range(3)]
+    fnames.append(tmp_path / "unknown-0-0.log")
+    df = pd.DataFrame(
+        {
+            "log_fname": [str(f) for f in fnames[:3]],
+            "npoints": [10, 30, 20],
+        },
+    )
+    run_manager.parse_log_files = lambda: df  # type: ignore[attr-defined]
+    sorted_fnames = _sort_fnames("npoints", run_manager, fnames)  # type: ignore[arg-type]
+    assert sorted_fnames == [
+        (f"30 pnts: {fnames[1].name}", fnames[1]),
+        (f"20 pnts: {fnames[2].name}", fnames[2]),
+        (f"10 pnts: {fnames[0].name}", fnames[0]),
+        (f"?: {fnames[3].name}", fnames[3]),
+    ]
+
+
+def test_sort_fnames_same_stem(tmp_path: Path) -> None:
+    """Test that _sort_fnames keeps the input order of the files that share a stem."""
+    run_manager = MockRunManager(tmp_path)
+    stem = f"{run_manager.job_name}-0-0"
+    fnames = [tmp_path / f"{stem}.log", tmp_path / f"{stem}.out"]
+    df = pd.DataFrame({"log_fname": [str(fnames[0])], "npoints": [10]})
+    run_manager.parse_log_files = lambda: df  # type: ignore[attr-defined]
+    sorted_fnames = _sort_fnames("npoints", run_manager, fnames)  # type: ignore[arg-type]
+    assert sorted_fnames == [
+        (f"10 pnts: {fnames[0].name}", fnames[0]),
+        (f"10 pnts: {fnames[1].name}", fnames[1]),
+    ]
+
+
+def test_sort_fnames_by_last_editted(tmp_path: Path) -> None:
+    """Test the _sort_fnames function sorting on the log timestamps."""
+    run_manager = MockRunManager(tmp_path)
+    fnames = [tmp_path / f"{run_manager.job_name}-{i}-{i * 100}.log" for i in range(2)]
+    now = pd.Timestamp.now()
+    df = pd.DataFrame(
+        {
+            "log_fname": [str(f) for f in fnames],
+            "timestamp": [now - pd.Timedelta(hours=1), now - pd.Timedelta(seconds=10)],
+        },
+    )
+    run_manager.parse_log_files = lambda: df  # type: ignore[attr-defined]
+    sorted_fnames = _sort_fnames("Last editted", run_manager, fnames)  # type: ignore[arg-type]
+    labeled: list[tuple[str, Path]] = []
+    for item in sorted_fnames:
+        assert isinstance(item, tuple)
+        labeled.append(item)
+    assert [fname for _, fname in labeled] == [fnames[1], fnames[0]]
+    label, _ = labeled[1]
+    assert label.startswith("360")
+    assert label.endswith(f"seconds ago: {fnames[0].name}")
+
+
+def test_sort_fnames_caches_parsed_logs(tmp_path: Path) -> None:
+    """Test that _sort_fnames only parses the logs again when they changed."""
+    run_manager = MockRunManager(tmp_path)
+    fname = tmp_path / f"{run_manager.job_name}-0-1000.log"  # a `log_fname` in the database
+    fname.write_text("Log 0")
+    df = pd.DataFrame({"log_fname": [str(fname)], "npoints": [10], "latest_loss": [0.1]})
+    n_calls = 0
+
+    def parse_log_files() -> pd.DataFrame:
+        nonlocal n_calls
+        n_calls += 1
+        return df
+
+    run_manager.parse_log_files = parse_log_files  # type: ignore[attr-defined]
+    _sort_fnames("npoints", run_manager, [fname])  # type: ignore[arg-type]
+    _sort_fnames("Loss", run_manager, [fname])  # type: ignore[arg-type]
+    assert n_calls == 1
+    mtime = fname.stat().st_mtime + 10
+    os.utime(fname, (mtime, mtime))
+    _sort_fnames("npoints", run_manager, [fname])  # type: ignore[arg-type]
+    assert n_calls == 2
+
+    # Only the `.out` file is displayed (e.g., when filtering), but the `.log` is parsed
+    out_fname = fname.with_suffix(".out")
+    out_fname.write_text("Output 0")
+    _sort_fnames("npoints", run_manager, [out_fname])  # type: ignore[arg-type]
+    assert n_calls == 2
+    mtime += 10
+    os.utime(fname, (mtime, mtime))
+    _sort_fnames("npoints", run_manager, [out_fname])  # type: ignore[arg-type]
+    assert n_calls == 3
+
+
 def test_results_widget(tmp_path: Path) -> None:
     """Test the results_widget function."""
     # Create some sample data files in DataFrame pickle format